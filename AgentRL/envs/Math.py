@@ -85,11 +85,4 @@ class MathEnv:
             result = f"Error executing {function_name}: {str(e)}"
             success = False
 
-        operation = {
-            "function": function_name,
-            "result": str(result),
-            "success": success,
-            "parameters": parameters
-        }
-
         return str(result), success
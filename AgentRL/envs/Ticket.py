@@ -61,11 +61,4 @@ class TicketEnv:
             result = f"Error executing {function_name}: {str(e)}"
             success = False
 
-        operation = {
-            "function": function_name,
-            "result": str(result),
-            "success": success,
-            "parameters": parameters
-        }
-
         return str(result), success
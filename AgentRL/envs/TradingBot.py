@@ -1,127 +1,57 @@
 from typing import Tuple, Dict, Any
 
-from eval_checker.multi_turn_eval.func_source_code.trading_bot import TradingBot, DEFAULT_STATE
+from eval_checker.multi_turn_eval.func_source_code.trading_bot import TradingBot
+from utils import dispatch_function_call
 
 class TradingBotEnv:
+    # GeneralEnv 每次 reset 都会重建子环境，固定属性集合省去实例 __dict__
+    __slots__ = ("trading_bot_api", "test_entry", "_dispatch")
+
     def __init__(self,test_entry: Dict[str, Any]):
         self.trading_bot_api = TradingBot()
         self.test_entry = test_entry
         self._load_scenario_from_test_entry()
 
+        api = self.trading_bot_api
+        self._dispatch = {
+            "_generate_transaction_timestamp": (api._generate_transaction_timestamp, False),
+            "get_current_time": (api.get_current_time, False),
+            "update_market_status": (api.update_market_status, True),
+            "get_symbol_by_name": (api.get_symbol_by_name, True),
+            "get_stock_info": (api.get_stock_info, True),
+            "get_order_details": (api.get_order_details, True),
+            "cancel_order": (api.cancel_order, True),
+            "place_order": (api.place_order, True),
+            "make_transaction": (api.make_transaction, True),
+            "get_account_info": (api.get_account_info, False),
+            "trading_login": (api.trading_login, True),
+            "trading_get_login_status": (api.trading_get_login_status, False),
+            "trading_logout": (api.trading_logout, False),
+            "fund_account": (api.fund_account, True),
+            "remove_stock_from_watchlist": (api.remove_stock_from_watchlist, True),
+            "get_watchlist": (api.get_watchlist, False),
+            "get_order_history": (api.get_order_history, False),
+            "get_transaction_history": (api.get_transaction_history, True),
+            "update_stock_price": (api.update_stock_price, True),
+            "get_available_stocks": (api.get_available_stocks, True),
+            "filter_stocks_by_price": (api.filter_stocks_by_price, True),
+            "add_to_watchlist": (api.add_to_watchlist, True),
+            "notify_price_change": (api.notify_price_change, True),
+        }
+
     def _load_scenario_from_test_entry(self):
         if "initial_config" in self.test_entry and "TradingBot" in self.test_entry["initial_config"]:
             self.trading_bot_api._load_scenario(self.test_entry["initial_config"]["TradingBot"])
         else:
-            default_scenario = DEFAULT_STATE
-            self.trading_bot_api._load_scenario(default_scenario)
+            # 传入空场景，由 _load_scenario 深拷贝默认值，避免多个实例共享并修改 DEFAULT_STATE 中的股票、自选股和交易记录
+            self.trading_bot_api._load_scenario({})
 
     def execute_function_call(self, function_name, parameters) -> Tuple[str, bool]:
         try:
-            if function_name == "_generate_transaction_timestamp":
-                result = self.trading_bot_api._generate_transaction_timestamp()
-                success = True
-
-            elif function_name == "get_current_time":
-                result = self.trading_bot_api.get_current_time()
-                success = True
-
-            elif function_name == "update_market_status":
-                result = self.trading_bot_api.update_market_status(**parameters)
-                success = True
-
-            elif function_name == "get_symbol_by_name":
-                result = self.trading_bot_api.get_symbol_by_name()
-                success = True
-
-            elif function_name == "get_stock_info":
-                result = self.trading_bot_api.get_stock_info(**parameters)
-                success = True
-
-            elif function_name == "get_order_details":
-                result = self.trading_bot_api.get_order_details(**parameters)
-                success = True
-
-            elif function_name == "cancel_order":
-                result = self.trading_bot_api.cancel_order(**parameters)
-                success = True
-
-            elif function_name == "place_order":
-                result = self.trading_bot_api.place_order(**parameters)
-                success = True
-
-            elif function_name == "make_transaction":
-                result = self.trading_bot_api.make_transaction(**parameters)
-                success = True
-
-            elif function_name == "get_account_info":
-                result = self.trading_bot_api.get_account_info()
-                success = True
-
-            elif function_name == "trading_login":
-                result = self.trading_bot_api.trading_login(**parameters)
-                success = True
-
-            elif function_name == "trading_get_login_status":
-                result = self.trading_bot_api.trading_get_login_status()
-                success = True
-
-            elif function_name == "trading_logout":
-                result = self.trading_bot_api.trading_logout()
-                success = True
-
-            elif function_name == "fund_account":
-                result = self.trading_bot_api.fund_account(**parameters)
-                success = True
-
-            elif function_name == "remove_stock_from_watchlist":
-                result = self.trading_bot_api.remove_stock_from_watchlist(**parameters)
-                success = True
-
-            elif function_name == "get_watchlist":
-                result = self.trading_bot_api.get_watchlist()
-                success = True
-
-            elif function_name == "get_order_history":
-                result = self.trading_bot_api.get_order_history()
-                success = True
-
-            elif function_name == "get_transaction_history":
-                result = self.trading_bot_api.get_transaction_history(**parameters)
-                success = True
-
-            elif function_name == "update_stock_price":
-                result = self.trading_bot_api.update_stock_price(**parameters)
-                success = True
-
-            elif function_name == "get_available_stocks":
-                result = self.trading_bot_api.get_available_stocks(**parameters)
-                success = True
-
-            elif function_name == "filter_stocks_by_price":
-                result = self.trading_bot_api.filter_stocks_by_price(**parameters)
-                success = True
-
-            elif function_name == "add_to_watchlist":
-                result = self.trading_bot_api.add_to_watchlist(**parameters)
-                success = True
-
-            elif function_name == "notify_price_change":
-                result = self.trading_bot_api.notify_price_change(**parameters)
-                success = True
-
-            else:
-                result = f"Function {function_name} not found in TradingBot"
-                success = False
+            result, success = dispatch_function_call(self._dispatch, function_name, parameters, "TradingBot")
 
         except Exception as e:
             result = f"Error executing {function_name}: {str(e)}"
             success = False
 
-        operation = {
-            "function": function_name,
-            "result": str(result),
-            "success": success,
-            "parameters": parameters
-        }
-
         return str(result), success
@@ -1,91 +1,47 @@
 from typing import Tuple, Dict, Any
 
-from eval_checker.multi_turn_eval.func_source_code.posting_api import TwitterAPI,DEFAULT_STATE
+from eval_checker.multi_turn_eval.func_source_code.twitter_api import TwitterAPI
+from utils import dispatch_function_call
 
 class TwitterEnv:
+    __slots__ = ("twitter_api", "test_entry", "_dispatch")
+
     def __init__(self,test_entry: Dict[str, Any]):
         self.twitter_api = TwitterAPI()
         self.test_entry = test_entry
         self._load_scenario_from_test_entry()
 
+        api = self.twitter_api
+        self._dispatch = {
+            "authenticate_twitter": (api.authenticate_twitter, True),
+            "posting_get_login_status": (api.posting_get_login_status, False),
+            "post_tweet": (api.post_tweet, True),
+            "retweet": (api.retweet, True),
+            "comment": (api.comment, True),
+            "mention": (api.mention, True),
+            "follow_user": (api.follow_user, True),
+            "list_all_following": (api.list_all_following, False),
+            "unfollow_user": (api.unfollow_user, True),
+            "get_tweet": (api.get_tweet, True),
+            "get_user_tweets": (api.get_user_tweets, True),
+            "search_tweets": (api.search_tweets, True),
+            "get_tweet_comments": (api.get_tweet_comments, True),
+            "get_user_stats": (api.get_user_stats, True),
+        }
+
     def _load_scenario_from_test_entry(self):
         if "initial_config" in self.test_entry and "TwitterAPI" in self.test_entry["initial_config"]:
             self.twitter_api._load_scenario(self.test_entry["initial_config"]["TwitterAPI"])
         else:
-            default_scenario = DEFAULT_STATE
-            self.twitter_api._load_scenario(default_scenario)
+            # 传入空场景，由 _load_scenario 深拷贝默认值，避免多个实例共享并修改 DEFAULT_STATE 中的列表和字典
+            self.twitter_api._load_scenario({})
 
     def execute_function_call(self, function_name, parameters) -> Tuple[str, bool]:
         try:
-            if function_name == "authenticate_twitter":
-                result = self.twitter_api.authenticate_twitter(**parameters)
-                success = True
-
-            elif function_name == "posting_get_login_status":
-                result = self.twitter_api.posting_get_login_status()
-                success = True
-
-            elif function_name == "post_tweet":
-                result = self.twitter_api.post_tweet(**parameters)
-                success = True
-
-            elif function_name == "retweet":
-                result = self.twitter_api.retweet(**parameters)
-                success = True
-
-            elif function_name == "comment":
-                result = self.twitter_api.comment(**parameters)
-                success = True
-
-            elif function_name == "mention":
-                result = self.twitter_api.mention(**parameters)
-                success = True
-
-            elif function_name == "follow_user":
-                result = self.twitter_api.follow_user(**parameters)
-                success = True
-
-            elif function_name == "list_all_following":
-                result = self.twitter_api.list_all_following()
-                success = True
-
-            elif function_name == "unfollow_user":
-                result = self.twitter_api.unfollow_user(**parameters)
-                success = True
-
-            elif function_name == "get_tweet":
-                result = self.twitter_api.get_tweet(**parameters)
-                success = True
-
-            elif function_name == "get_user_tweets":
-                result = self.twitter_api.get_user_tweets(**parameters)
-                success = True
-
-            elif function_name == "search_tweets":
-                result = self.twitter_api.search_tweets(**parameters)
-                success = True
-
-            elif function_name == "get_tweet_comments":
-                result = self.twitter_api.get_tweet_comments(**parameters)
-                success = True
-
-            elif function_name == "get_user_stats":
-                result = self.twitter_api.get_user_stats(**parameters)
-                success = True
-
-            else:
-                result = f"Function {function_name} not found in TwitterAPI"
-                success = False
+            result, success = dispatch_function_call(self._dispatch, function_name, parameters, "TwitterAPI")
 
         except Exception as e:
             result = f"Error executing {function_name}: {str(e)}"
             success = False
 
-        operation = {
-            "function": function_name,
-            "result": str(result),
-            "success": success,
-            "parameters": parameters
-        }
-
         return str(result), success
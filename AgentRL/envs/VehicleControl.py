@@ -1,113 +1,53 @@
 from typing import Tuple, Dict, Any
 
-from eval_checker.multi_turn_eval.func_source_code.vehicle_control import VehicleControlAPI,DEFAULT_STATE
+from eval_checker.multi_turn_eval.func_source_code.vehicle_control import VehicleControlAPI
+from utils import dispatch_function_call
 
 class VehicleControlEnv:
+    __slots__ = ("vehicle_api", "test_entry", "_dispatch")
+
     def __init__(self,test_entry: Dict[str, Any]):
         self.vehicle_api = VehicleControlAPI()
         self.test_entry = test_entry
         self._load_scenario_from_test_entry()
 
+        api = self.vehicle_api
+        self._dispatch = {
+            "start_engine": (api.startEngine, True),
+            "fill_fuel_tank": (api.fillFuelTank, True),
+            "lock_doors": (api.lockDoors, True),
+            "get_outside_temperature_from_google": (api.get_outside_temperature_from_google, False),
+            "set_head_lights": (api.setHeadlights, True),
+            "display_car_status": (api.displayCarStatus, True),
+            "activate_parking_brake": (api.activateParkingBrake, True),
+            "press_brake_pedal": (api.pressBrakePedal, True),
+            "release_brake_pedal": (api.releaseBrakePedal, False),
+            "set_cruise_control": (api.setCruiseControl, True),
+            "get_current_speed": (api.get_current_speed, False),
+            "display_log": (api.display_log, True),
+            "estimate_drive_feasibility_by_mileage": (api.estimate_drive_feasibility_by_mileage, True),
+            "liter_to_gallon": (api.liter_to_gallon, True),
+            "estimate_distance": (api.estimate_distance, True),
+            "get_zipcode_based_on_city": (api.get_zipcode_based_on_city, True),
+            "set_navigation": (api.set_navigation, True),
+            "check_tire_pressure": (api.check_tire_pressure, False),
+            "find_nearest_tire_shop": (api.find_nearest_tire_shop, False),
+        }
+
     def _load_scenario_from_test_entry(self):
         # 从 test_entry 中获取 initial_config 并加载
         if "initial_config" in self.test_entry and "VehicleControlAPI" in self.test_entry["initial_config"]:
             self.vehicle_api._load_scenario(self.test_entry["initial_config"]["VehicleControlAPI"])
         else:
-            default_scenario = DEFAULT_STATE
-            self.vehicle_api._load_scenario(default_scenario)
+            # 传入空场景，由 _load_scenario 深拷贝默认值，避免多个实例共享并修改 DEFAULT_STATE 中的 doorStatus
+            self.vehicle_api._load_scenario({})
 
     def execute_function_call(self, function_name, parameters) -> Tuple[str, bool]:
         try:
-            if function_name == "start_engine":
-                result = self.vehicle_api.startEngine(**parameters)
-                success = True
-
-            elif function_name == "fill_fuel_tank":
-                result = self.vehicle_api.fillFuelTank(**parameters)
-                success = True
-
-            elif function_name == "lock_doors":
-                result = self.vehicle_api.lockDoors(**parameters)
-                success = True
-
-            elif function_name == "get_outside_temperature_from_google":
-                result = self.vehicle_api.get_outside_temperature_from_google()
-                success = True
-
-            elif function_name == "set_head_lights":
-                result = self.vehicle_api.setHeadlights(**parameters)
-                success = True
-
-            elif function_name == "display_car_status":
-                result = self.vehicle_api.displayCarStatus(**parameters)
-                success = True
-
-            elif function_name == "activate_parking_brake":
-                result = self.vehicle_api.activateParkingBrake(**parameters)
-                success = True
-
-            elif function_name == "press_brake_pedal":
-                result = self.vehicle_api.pressBrakePedal(**parameters)
-                success = True
-
-            elif function_name == "release_brake_pedal":
-                result = self.vehicle_api.releaseBrakePedal()
-                success = True
-
-            elif function_name == "set_cruise_control":
-                result = self.vehicle_api.setCruiseControl(**parameters)
-                success = True
-
-            elif function_name == "get_current_speed":
-                result = self.vehicle_api.get_current_speed()
-                success = True
-
-            elif function_name == "display_log":
-                result = self.vehicle_api.display_log(**parameters)
-                success = True
-
-            elif function_name == "estimate_drive_feasibility_by_mileage":
-                result = self.vehicle_api.estimate_drive_feasibility_by_mileage(**parameters)
-                success = True
-
-            elif function_name == "liter_to_gallon":
-                result = self.vehicle_api.liter_to_gallon(**parameters)
-                success = True
-
-            elif function_name == "estimate_distance":
-                result = self.vehicle_api.estimate_distance(**parameters)
-                success = True
-
-            elif function_name == "get_zipcode_based_on_city":
-                result = self.vehicle_api.get_zipcode_based_on_city(**parameters)
-                success = True
-
-            elif function_name == "set_navigation":
-                result = self.vehicle_api.set_navigation(**parameters)
-                success = True
-
-            elif function_name == "check_tire_pressure":
-                result = self.vehicle_api.check_tire_pressure()
-                success = True
-
-            elif function_name == "find_nearest_tire_shop":
-                result = self.vehicle_api.find_nearest_tire_shop()
-                success = True
-
-            else:
-                result = f"Function {function_name} not found in VehicleControlAPI"
-                success = False
+            result, success = dispatch_function_call(self._dispatch, function_name, parameters, "VehicleControlAPI")
 
         except Exception as e:
             result = f"Error executing {function_name}: {str(e)}"
             success = False
 
-        operation = {
-            "function": function_name,
-            "result": str(result),
-            "success": success,
-            "parameters": parameters
-        }
-
-
         return str(result), success
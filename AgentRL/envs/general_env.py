@@ -1,7 +1,7 @@
 import gymnasium as gym
 from gymnasium import spaces
 from utils import FunctionCallExecutor, StateManager
-from typing import Dict, Any, Tuple, Optional, Union
+from typing import Dict, Any, Tuple, Optional
 from Travel import TravelBookingEnv
 from VehicleControl import VehicleControlEnv
 from WebSearch import WebSearchEnv
@@ -11,7 +11,26 @@ from Ticket import TicketEnv
 from Message import MessageEnv
 from Math import MathEnv
 from File import FileEnv
-import numpy as np
+
+DEFAULT_REWARD_CONFIG = {
+    "correct_function_call": 1.0,
+    "incorrect_function_call": -1.0,
+    "correct_state": 0.5,
+    "state_mismatch": -0.5,
+    "turn_penalty": -0.1,
+    "task_completion": 10.0,
+    "task_failure": -5.0,
+}
+
+# 观察空间中所有文本字段共用的字符集
+CHARSET = frozenset("0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ_abcdefghijklmnopqrstuvwxyz .,!?;:-()")
+
+# 解析函数调用参数时使用的常量
+BOOL_VALUES = {"true": True, "false": False}
+NUMBER_START_CHARS = frozenset("+-.0123456789")
+NUMBER_CHARS = frozenset("+-.0123456789eE")
+# 函数文档中声明的参数类型 -> 转换函数，未列出的类型按取值推断
+PARAM_CONVERTERS = {"integer": int, "float": float, "number": float}
 
 
 class GeneralEnv(gym.Env):
@@ -35,6 +54,8 @@ class GeneralEnv(gym.Env):
         self.max_turns = max_turns
         self.current_turn = 0
         self.task_type = task_type
+        self.reward_config = {**DEFAULT_REWARD_CONFIG, **(reward_config or {})}
+        self._setup_rewards()
 
         # 初始化执行器和状态管理器
         self.executor = FunctionCallExecutor(test_entry)
@@ -61,6 +82,15 @@ class GeneralEnv(gym.Env):
         """设置初始状态"""
         self.current_question = self.test_entry["question"][0][0]["content"]
         self.function_docs = self.test_entry["function"]
+        # 函数文档在整个回合内不变，只在此处转换一次供观察复用
+        self.function_docs_obs = tuple(self.function_docs)
+        self.available_actions = tuple(func["name"] for func in self.function_docs)
+        # (函数名, 参数名) -> 声明的参数类型，解析参数时按声明类型转换
+        self.param_types = {
+            (func["name"], item["properties_key"]): item["properties_value"].get("type")
+            for func in self.function_docs
+            for item in func["parameters"]["properties"]
+        }
         self.involved_classes = self.test_entry.get("involved_classes", [])
         self.initial_config = self.test_entry.get("initial_config", {})
 
@@ -76,11 +106,13 @@ class GeneralEnv(gym.Env):
     def _setup_spaces(self):
         """设置动作和观察空间"""
         self.action_space = spaces.Discrete(len(self.function_docs) + 1)  # +1 for "no action"
-        charset = frozenset("0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ_abcdefghijklmnopqrstuvwxyz .,!?;:-()")
+        charset = CHARSET
+        # 函数文档和可用动作的数量在整个环境生命周期内固定，使用定长 Tuple 便于向量化环境直接堆叠
+        num_functions = len(self.function_docs)
         obs_space = {
             "question": spaces.Text(1000, charset=charset),  # 用户问题
-            "function_docs": spaces.Sequence(  # 函数文档列表
-                spaces.Dict({
+            "function_docs": spaces.Tuple(  # 函数文档列表
+                (spaces.Dict({
                     "name": spaces.Text(100, charset=charset),
                     "description": spaces.Text(500, charset=charset),
                     "parameters": spaces.Dict({'type': spaces.Text(100,charset=charset),
@@ -100,7 +132,7 @@ class GeneralEnv(gym.Env):
                                                ),
                                                'env':spaces.Text(100, charset=charset)
                     })
-                }),
+                }),) * num_functions
             ),
             "current_state": spaces.Dict({  # 当前环境状态
                 "turn": spaces.Discrete(self.max_turns + 1),
@@ -111,8 +143,8 @@ class GeneralEnv(gym.Env):
                 max_length=1000,
                 charset=charset,
             ),  # 上次执行结果
-            "available_actions": spaces.Sequence(  # 可用动作列表
-                spaces.Text(100, charset=charset),
+            "available_actions": spaces.Tuple(  # 可用动作列表
+                (spaces.Text(100, charset=charset),) * num_functions
             )
         }
 
@@ -121,12 +153,12 @@ class GeneralEnv(gym.Env):
     def _get_observation(self) -> Dict:
         """获取当前观察状态"""
         return {
-            "available_actions": tuple([func["name"] for func in self.function_docs]),
+            "available_actions": self.available_actions,
             "current_state": {
                 "turn": self.current_turn,
                 "execution_history": tuple([str(item) for item in self.execution_history[-5:]])  # 最近5次
             },
-            "function_docs": tuple(self.function_docs),
+            "function_docs": self.function_docs_obs,
             "last_execution_result": self.execution_history[-1]["result"] if self.execution_history else "",
             "question": self.current_question
         }
@@ -142,67 +174,77 @@ class GeneralEnv(gym.Env):
             "state_consistency": self.state_manager.check_state_consistency()
         }
 
-    def _extract_function_name(self, function_call: str) -> str:
-        """提取函数名"""
-        if "(" in function_call:
-            return function_call.split("(")[0].strip()
-        return function_call.strip()
-
-    def _extract_parameters(self, function_call: str) -> Dict[str, Any]:
-        """从函数调用中提取参数"""
+    def _parse_function_call(self, function_call: str) -> Tuple[str, Dict[str, Any]]:
+        """一次切分函数调用字符串，同时提取函数名和参数"""
+        name, _, rest = function_call.partition("(")
+        name = name.strip()
         params = {}
-        if "(" in function_call and ")" in function_call:
-            param_str = function_call.split("(")[1].split(")")[0]
-            if "=" in param_str:
-                for param in param_str.split(","):
-                    if "=" in param:
-                        key, value = param.split("=", 1)
-                        key = key.strip()
-                        value = value.strip().strip('"\'')
-
-                        # 尝试转换数据类型
-                        if value.lower() in ["true", "false"]:
-                            params[key] = value.lower() == "true"
-                        elif value.isdigit():
-                            params[key] = int(value)
-                        elif self._is_float(value):
-                            params[key] = float(value)
-                        else:
-                            params[key] = value
-        return params
-
-    def _is_float(self, value: str) -> bool:
-        """检查字符串是否可以转换为浮点数"""
-        try:
-            float(value)
-            return True
-        except ValueError:
-            return False
+        param_str, has_close, _ = rest.partition(")")
+        # 没有闭合括号，视为没有参数
+        if not has_close:
+            return name, params
+
+        for param in param_str.split(","):
+            key, has_eq, value = param.partition("=")
+            if has_eq:
+                key = key.strip()
+                value = value.strip().strip('"\'')
+                params[key] = self._convert_value(value, self.param_types.get((name, key)))
+        return name, params
+
+    def _convert_value(self, value: str, declared_type: Optional[str] = None) -> Any:
+        """按声明的参数类型转换参数值，没有可用的声明类型时推断为布尔值、整数或浮点数"""
+        # 声明为字符串的参数保持原样，例如纯数字的卡号不会被转换成整数
+        if declared_type == "string":
+            return value
+        converter = PARAM_CONVERTERS.get(declared_type)
+        if converter is not None:
+            try:
+                return converter(value)
+            except ValueError:
+                pass
+
+        lowered = value.lower()
+        if lowered in BOOL_VALUES:
+            return BOOL_VALUES[lowered]
+        # 只有以数字、符号或小数点开头的值才可能是数字
+        if value and value[0] in NUMBER_START_CHARS:
+            digits = value[1:] if value[0] in "+-" else value
+            if digits.isdecimal():
+                return int(value)
+            # 含有其他字符的值不可能是浮点数，避免为其触发异常
+            if NUMBER_CHARS.issuperset(value):
+                try:
+                    return float(value)
+                except ValueError:
+                    pass
+        return value
+
+    def _setup_rewards(self):
+        """根据奖励配置预先计算各项奖励，step 中不再逐项查表"""
+        config = self.reward_config
+        # 函数调用奖励/惩罚与轮次惩罚每步都会叠加，合并为一项
+        self.call_rewards = {
+            True: config["correct_function_call"] + config["turn_penalty"],
+            False: config["incorrect_function_call"] + config["turn_penalty"],
+        }
+        self.state_rewards = {
+            True: config["correct_state"],
+            False: config["state_mismatch"],
+        }
+        self.task_completion_reward = config["task_completion"]
+        self.task_failure_reward = config["task_failure"]
 
     def _compute_reward(self, execution_success: bool, execution_result: str) -> float:
-        reward = 0.0
-
-        # 基础奖励/惩罚
-        if execution_success:
-            reward += self.reward_config["correct_function_call"]
-        else:
-            reward += self.reward_config["incorrect_function_call"]
-
-        # 状态检查奖励
-        state_match = self.state_manager.check_state_consistency()
-        if state_match:
-            reward += self.reward_config["correct_state"]
-        else:
-            reward += self.reward_config["state_mismatch"]
-
-        # 轮次惩罚
-        reward += self.reward_config["turn_penalty"]
+        # 基础奖励/惩罚（含轮次惩罚）与状态检查奖励
+        reward = self.call_rewards[bool(execution_success)]
+        reward += self.state_rewards[bool(self.state_manager.check_state_consistency())]
 
         # 任务完成奖励/惩罚
         if self.task_completed:
-            reward += self.reward_config["task_completion"]
-        elif self.done and not self.task_completed:
-            reward += self.reward_config["task_failure"]
+            reward += self.task_completion_reward
+        elif self.done:
+            reward += self.task_failure_reward
 
         self.reward_history.append(reward)
         return reward
@@ -261,8 +303,7 @@ class GeneralEnv(gym.Env):
 
         # 解析动作
         function_call = self._parse_action(int(action))
-        function_name = self._extract_function_name(function_call)
-        function_param = self._extract_parameters(function_call)
+        function_name, function_param = self._parse_function_call(function_call)
         function_env = self.function_docs[action]['parameters']['env']
         if function_env == 'travel':
             execution_result, execution_success = self.travel_env.execute_function_call(function_name = function_name,parameters=function_param)
@@ -285,9 +326,8 @@ class GeneralEnv(gym.Env):
         else:
             execution_result = f"No env named {function_name}"
             execution_success = False
-        print("env： "+str(function_env))
-        print("execution_result: "+ str(execution_result))
-        print("execution_success: " + str(execution_success))
+        # 合并为一次输出，避免每步多次写 stdout
+        print(f"env： {function_env}\nexecution_result: {execution_result}\nexecution_success: {execution_success}")
         self._update_state(execution_result, execution_success)
         self._check_completion()
         reward = self._compute_reward(execution_success, execution_result)
@@ -1,9 +1,44 @@
 import copy
-import json
 import re
-from typing import Dict, List, Any, Optional, Tuple
+from collections import deque
+from typing import Dict, List, Any, Tuple, Callable
 import importlib
 
+FUNCTION_NAME_PATTERN = re.compile(r"\b([a-zA-Z_]\w*)\s*(?=\()")
+TIMESTAMP_PATTERN = re.compile(r'\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d+Z')
+# 同时覆盖 id / ID / vec_id（vec_id 以 id 结尾），一次扫描完成替换
+ID_PATTERN = re.compile(r'(id|ID):\s*\d+')
+# 状态检查只读取最近一次执行结果，保留少量历史即可
+EXECUTION_RESULTS_MAXLEN = 16
+
+
+def dispatch_function_call(
+    dispatch: Dict[str, Tuple[Callable, bool]],
+    function_name: str,
+    parameters: Dict[str, Any],
+    api_name: str
+) -> Tuple[Any, bool]:
+    """
+    按函数名在子环境的分发表中查找并调用 API 方法
+
+    各子环境在构造时建立一次 函数名 -> (API 方法, 是否接收参数) 的分发表，避免逐个比较函数名。
+    API 方法抛出的异常不在这里处理，由调用方统一记录。
+
+    Args:
+        dispatch: 函数名到 (API 方法, 是否接收参数) 的映射
+        function_name: 要调用的函数名
+        parameters: 函数参数
+        api_name: API 名称，用于未找到函数时的提示
+
+    Returns:
+        (执行结果, 是否成功)
+    """
+    entry = dispatch.get(function_name)
+    if entry is None:
+        return f"Function {function_name} not found in {api_name}", False
+    function, takes_parameters = entry
+    return (function(**parameters) if takes_parameters else function()), True
+
 
 class FunctionCallExecutor:
     """
@@ -101,8 +136,7 @@ class FunctionCallExecutor:
             return func_name
 
         # 正则表达式匹配函数名
-        pattern = r"\b([a-zA-Z_]\w*)\s*(?=\()"
-        processed_call = re.sub(pattern, replace_function, func_call)
+        processed_call = FUNCTION_NAME_PATTERN.sub(replace_function, func_call)
         return processed_call
 
     def _safe_execute(self, func_call: str) -> Any:
@@ -142,12 +176,14 @@ class StateManager:
         self.initial_config = test_entry.get("initial_config", {})
         self.goal_state = test_entry.get("goal_state", {})
         self.current_state = {}
-        self.execution_results = []
+        self.execution_results = deque(maxlen=EXECUTION_RESULTS_MAXLEN)
+        self.execution_count = 0
 
     def reset(self):
         """重置状态管理器"""
         self.current_state = {}
-        self.execution_results = []
+        self.execution_results.clear()
+        self.execution_count = 0
 
     def load_initial_config(self, config: Dict[str, Any]):
         """加载初始配置"""
@@ -157,8 +193,11 @@ class StateManager:
         """根据执行结果更新状态"""
         self.execution_results.append({
             "result": execution_result,
-            "success": execution_success
+            "success": execution_success,
+            # 写入时判定一次是否包含错误信息，后续检查直接读取该标记
+            "has_error": "error" in execution_result.lower()
         })
+        self.execution_count += 1
 
         # 这里可以根据执行结果更新状态
         # 具体实现需要根据不同的API类型来定
@@ -173,7 +212,7 @@ class StateManager:
         # 简化实现，实际中需要根据具体任务来定义
         if len(self.execution_results) > 0:
             last_result = self.execution_results[-1]
-            return last_result["success"] and "error" not in last_result["result"].lower()
+            return last_result["success"] and not last_result["has_error"]
         return False
 
     def is_failed(self) -> bool:
@@ -187,7 +226,7 @@ class StateManager:
         """获取状态摘要"""
         return {
             "current_state": self.current_state,
-            "execution_count": len(self.execution_results),
+            "execution_count": self.execution_count,
             "last_success": self.execution_results[-1]["success"] if self.execution_results else True,
             "goal_achieved": self.is_goal_achieved()
         }
@@ -313,9 +352,7 @@ class MultiTurnEvaluator:
     def _clean_result(self, result: str) -> str:
         """清理结果字符串，移除时间戳等变量信息"""
         # 移除常见的时间戳和ID模式
-        result = re.sub(r'\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d+Z', '', result)
-        result = re.sub(r'id:\s*\d+', 'id: X', result)
-        result = re.sub(r'ID:\s*\d+', 'ID: X', result)
-        result = re.sub(r'vec_id:\s*\d+', 'vec_id: X', result)
+        result = TIMESTAMP_PATTERN.sub('', result)
+        result = ID_PATTERN.sub(r'\1: X', result)
 
         return result.strip()
@@ -13,6 +13,8 @@ MAX_CORE_MEMORY_SIZE = 7
 MAX_CORE_MEMORY_ENTRY_LENGTH = 300
 MAX_ARCHIVAL_MEMORY_SIZE = 50
 MAX_ARCHIVAL_MEMORY_ENTRY_LENGTH = 2000
+# snake_case keys without spaces
+KEY_FORMAT_PATTERN = re.compile(r"^[a-z]+(_[a-z0-9]+)*$")
 
 
 class MemoryAPI_kv(MemoryAPI):
@@ -92,8 +94,7 @@ class MemoryAPI_kv(MemoryAPI):
         """
         Check if the key is in snake_case format and does not contain spaces.
         """
-        pattern = r"^[a-z]+(_[a-z0-9]+)*$"
-        return bool(re.match(pattern, s))
+        return bool(KEY_FORMAT_PATTERN.match(s))
 
     def core_memory_add(self, key: str, value: str) -> Dict[str, str]:
         """
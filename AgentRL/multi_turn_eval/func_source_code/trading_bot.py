@@ -14,6 +14,8 @@ from eval_checker.multi_turn_eval.func_source_code.long_context import (
 )
 
 CURRENT_TIME = datetime(2024, 9, 1, 10, 30)
+# CURRENT_TIME is fixed, so its display string only needs formatting once
+CURRENT_TIME_STR = CURRENT_TIME.strftime("%I:%M %p")
 
 DEFAULT_STATE = {
     "orders": {
@@ -126,6 +128,32 @@ DEFAULT_STATE = {
     "random_seed": 1053520,
 }
 
+SYMBOL_MAP = {
+    "Apple": "AAPL",
+    "Google": "GOOG",
+    "Tesla": "TSLA",
+    "Microsoft": "MSFT",
+    "Nvidia": "NVDA",
+    "Zeta Corp": "ZETA",
+    "Alpha Tech": "ALPH",
+    "Omega Industries": "OMEG",
+    "Quasar Ltd.": "QUAS",
+    "Neptune Systems": "NEPT",
+    "Synex Solutions": "SYNX",
+    "Amazon": "AMZN",
+    "Gorilla": "GORI",
+}
+
+SECTOR_MAP = {
+    "Technology": ("AAPL", "GOOG", "MSFT", "NVDA"),
+    "Automobile": ("TSLA", "F", "GM"),
+}
+
+SECTOR_EXTENSION = {
+    "Technology": TECHNOLOGY_EXTENSION,
+    "Automobile": AUTOMOBILE_EXTENSION,
+}
+
 
 class TradingBot:
     """
@@ -163,31 +191,45 @@ class TradingBot:
         Args:
             scenario (dict): A scenario dictionary containing data to load.
         """
-        DEFAULT_STATE_COPY = deepcopy(DEFAULT_STATE)
-        self.orders = scenario.get("orders", DEFAULT_STATE_COPY["orders"])
+        # Scalar defaults are immutable and shared as is; containers are deep copied only when missing
+        self.orders = (
+            scenario["orders"] if "orders" in scenario else deepcopy(DEFAULT_STATE["orders"])
+        )
         # Convert all string keys that can be interpreted as integers to integer keys
         self.orders = {
             int(k) if isinstance(k, str) and k.isdigit() else k: v
             for k, v in self.orders.items()
         }
-        self.account_info = scenario.get("account_info", DEFAULT_STATE_COPY["account_info"])
+        self.account_info = (
+            scenario["account_info"]
+            if "account_info" in scenario
+            else deepcopy(DEFAULT_STATE["account_info"])
+        )
         self.authenticated = scenario.get(
-            "authenticated", DEFAULT_STATE_COPY["authenticated"]
+            "authenticated", DEFAULT_STATE["authenticated"]
         )
         self.market_status = scenario.get(
-            "market_status", DEFAULT_STATE_COPY["market_status"]
+            "market_status", DEFAULT_STATE["market_status"]
         )
         self.order_counter = scenario.get(
-            "order_counter", DEFAULT_STATE_COPY["order_counter"]
+            "order_counter", DEFAULT_STATE["order_counter"]
         )  # Start counter from the next order ID
-        self.stocks = scenario.get("stocks", DEFAULT_STATE_COPY["stocks"])
-        self.watch_list = scenario.get("watch_list", DEFAULT_STATE_COPY["watch_list"])
-        self.transaction_history = scenario.get(
-            "transaction_history", DEFAULT_STATE_COPY["transaction_history"]
+        self.stocks = (
+            scenario["stocks"] if "stocks" in scenario else deepcopy(DEFAULT_STATE["stocks"])
+        )
+        self.watch_list = (
+            scenario["watch_list"]
+            if "watch_list" in scenario
+            else deepcopy(DEFAULT_STATE["watch_list"])
+        )
+        self.transaction_history = (
+            scenario["transaction_history"]
+            if "transaction_history" in scenario
+            else deepcopy(DEFAULT_STATE["transaction_history"])
         )
         self.long_context = long_context
         self._random = random.Random(
-            (scenario.get("random_seed", DEFAULT_STATE_COPY["random_seed"]))
+            (scenario.get("random_seed", DEFAULT_STATE["random_seed"]))
         )
 
     def _generate_transaction_timestamp(self) -> str:
@@ -219,7 +261,7 @@ class TradingBot:
         Returns:
             current_time (str): Current time in HH:MM AM/PM format.
         """
-        return {"current_time": CURRENT_TIME.strftime("%I:%M %p")}
+        return {"current_time": CURRENT_TIME_STR}
 
     def update_market_status(self, current_time_str: str) -> Dict[str, str]:
         """
@@ -253,23 +295,7 @@ class TradingBot:
         Returns:
             symbol (str): Symbol of the stock or "Stock not found" if not available.
         """
-        symbol_map = {
-            "Apple": "AAPL",
-            "Google": "GOOG",
-            "Tesla": "TSLA",
-            "Microsoft": "MSFT",
-            "Nvidia": "NVDA",
-            "Zeta Corp": "ZETA",
-            "Alpha Tech": "ALPH",
-            "Omega Industries": "OMEG",
-            "Quasar Ltd.": "QUAS",
-            "Neptune Systems": "NEPT",
-            "Synex Solutions": "SYNX",
-            "Amazon": "AMZN",
-            "Gorilla": "GORI",
-        }
-
-        return {"symbol": symbol_map.get(name, "Stock not found")}
+        return {"symbol": SYMBOL_MAP.get(name, "Stock not found")}
 
     def get_stock_info(self, symbol: str) -> Dict[str, Union[float, int, str]]:
         """
@@ -604,22 +630,24 @@ class TradingBot:
                 }
             ]
 
+        # Timestamps are stored as 'YYYY-MM-DD HH:MM:SS', whose string order matches
+        # chronological order, so the bounds are formatted once and compared as strings
+        # instead of parsing every transaction in the history.
         if start_date:
-            start = datetime.strptime(start_date, "%Y-%m-%d")
+            start = datetime.strptime(start_date, "%Y-%m-%d").strftime("%Y-%m-%d %H:%M:%S")
         else:
-            start = datetime.min
+            start = ""
 
         if end_date:
-            end = datetime.strptime(end_date, "%Y-%m-%d")
+            end = datetime.strptime(end_date, "%Y-%m-%d").strftime("%Y-%m-%d %H:%M:%S")
         else:
-            end = datetime.max
+            end = None
 
         filtered_history = [
             transaction
             for transaction in self.transaction_history
-            if start
-            <= datetime.strptime(transaction["timestamp"], "%Y-%m-%d %H:%M:%S")
-            <= end
+            if start <= transaction["timestamp"]
+            and (end is None or transaction["timestamp"] <= end)
         ]
 
         if self.long_context:
@@ -664,15 +692,10 @@ class TradingBot:
         Returns:
             stock_list (List[str]): List of stock symbols in the specified sector.
         """
-        sector_map = {
-            "Technology": ["AAPL", "GOOG", "MSFT", "NVDA"],
-            "Automobile": ["TSLA", "F", "GM"],
-        }
-
+        stock_list = list(SECTOR_MAP.get(sector, ()))
         if self.long_context:
-            sector_map["Technology"].extend(TECHNOLOGY_EXTENSION)
-            sector_map["Automobile"].extend(AUTOMOBILE_EXTENSION)
-        return {"stock_list": sector_map.get(sector, [])}
+            stock_list.extend(SECTOR_EXTENSION.get(sector, ()))
+        return {"stock_list": stock_list}
 
     def filter_stocks_by_price(
         self, stocks: List[str], min_price: float, max_price: float
@@ -688,11 +711,11 @@ class TradingBot:
         Returns:
             filtered_stocks (List[str]): Filtered list of stock symbols within the price range.
         """
+        # Look up each price once; the chained comparison evaluates it a single time
         filtered_stocks = [
             symbol
             for symbol in stocks
-            if self.stocks.get(symbol, {}).get("price", 0) >= min_price
-            and self.stocks.get(symbol, {}).get("price", 0) <= max_price
+            if min_price <= self.stocks.get(symbol, {}).get("price", 0) <= max_price
         ]
         return {"filtered_stocks": filtered_stocks}
 
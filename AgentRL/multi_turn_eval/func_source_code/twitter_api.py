@@ -32,21 +32,29 @@ class TwitterAPI:
         Args:
             scenario (dict): A dictionary containing Twitter data.
         """
-        DEFAULT_STATE_COPY = deepcopy(DEFAULT_STATE)
-        self.username = scenario.get("username", DEFAULT_STATE_COPY["username"])
-        self.password = scenario.get("password", DEFAULT_STATE_COPY["password"])
+        # Only the container defaults need a private copy; the scalar defaults are immutable
+        self.username = scenario.get("username", DEFAULT_STATE["username"])
+        self.password = scenario.get("password", DEFAULT_STATE["password"])
         self.authenticated = scenario.get(
-            "authenticated", DEFAULT_STATE_COPY["authenticated"]
+            "authenticated", DEFAULT_STATE["authenticated"]
+        )
+        self.tweets = (
+            scenario["tweets"] if "tweets" in scenario else deepcopy(DEFAULT_STATE["tweets"])
         )
-        self.tweets = scenario.get("tweets", DEFAULT_STATE_COPY["tweets"])
         self.tweets = {int(k): v for k, v in self.tweets.items()} # Convert tweet keys from string to int from loaded scenario
-        self.comments = scenario.get("comments", DEFAULT_STATE_COPY["comments"])
-        self.retweets = scenario.get("retweets", DEFAULT_STATE_COPY["retweets"])
-        self.following_list = scenario.get(
-            "following_list", DEFAULT_STATE_COPY["following_list"]
+        self.comments = (
+            scenario["comments"] if "comments" in scenario else deepcopy(DEFAULT_STATE["comments"])
+        )
+        self.retweets = (
+            scenario["retweets"] if "retweets" in scenario else deepcopy(DEFAULT_STATE["retweets"])
+        )
+        self.following_list = (
+            scenario["following_list"]
+            if "following_list" in scenario
+            else deepcopy(DEFAULT_STATE["following_list"])
         )
         self.tweet_counter = scenario.get(
-            "tweet_counter", DEFAULT_STATE_COPY["tweet_counter"]
+            "tweet_counter", DEFAULT_STATE["tweet_counter"]
         )
 
     def authenticate_twitter(self, username: str, password: str) -> Dict[str, bool]:
@@ -267,11 +275,13 @@ class TwitterAPI:
                 - tags (List[str]): List of tags associated with the tweet.
                 - mentions (List[str]): List of users mentioned in the tweet.
         """
+        # Lower the keyword once instead of once per tweet and per tag
+        keyword = keyword.lower()
         return [
             tweet
             for tweet in self.tweets.values()
-            if keyword.lower() in tweet["content"].lower()
-            or keyword.lower() in [tag.lower() for tag in tweet["tags"]]
+            if keyword in tweet["content"].lower()
+            or keyword in [tag.lower() for tag in tweet["tags"]]
         ]
 
     def get_tweet_comments(self, tweet_id: int) -> List[Dict[str, str]]:
@@ -46,6 +46,36 @@ DEFAULT_STATE = {
     "rearRightTirePressure": 30.0,
 }
 
+CITY_ZIPCODES = {
+    "Rivermist": "83214",
+    "Stonebrook": "74532",
+    "Maplecrest": "56108",
+    "Silverpine": "62947",
+    "Shadowridge": "71354",
+    "Sunset Valley": "83462",
+    "Oakendale": "47329",
+    "Willowbend": "52013",
+    "Crescent Hollow": "69238",
+    "Autumnville": "51479",
+    "San Francisco": "94016",
+}
+
+# Distances in km between zipcode pairs; the pair is unordered so either city can come first
+CITY_DISTANCES = {
+    frozenset(("83214", "74532")): 750.0,
+    frozenset(("56108", "62947")): 320.0,
+    frozenset(("71354", "83462")): 450.0,
+    frozenset(("47329", "52013")): 290.0,
+    frozenset(("69238", "51479")): 630.0,
+    frozenset(("94016", "83214")): 980.0,
+    frozenset(("94016", "94704")): 600.0,
+    frozenset(("94704", "08540")): 2550.0,
+    frozenset(("94016", "08540")): 1950.0,
+    frozenset(("62947", "47329")): 1053.0,
+    frozenset(("94016", "62947")): 780.0,
+    frozenset(("74532", "94016")): 880.0,
+}
+
 
 class VehicleControlAPI:
 
@@ -84,75 +114,76 @@ class VehicleControlAPI:
         Args:
             scenario (Dict): The scenario to load.
         """
-        DEFAULT_STATE_COPY = deepcopy(DEFAULT_STATE)
         self._random = random.Random(
-            (scenario.get("random_seed", DEFAULT_STATE_COPY["random_seed"]))
+            (scenario.get("random_seed", DEFAULT_STATE["random_seed"]))
         )
         self.fuelLevel = scenario.get(
-            "fuelLevel", DEFAULT_STATE_COPY["fuelLevel"]
+            "fuelLevel", DEFAULT_STATE["fuelLevel"]
         )  # in gallons
         self.batteryVoltage = scenario.get(
-            "batteryVoltage", DEFAULT_STATE_COPY["batteryVoltage"]
+            "batteryVoltage", DEFAULT_STATE["batteryVoltage"]
         )  # in volts
         self.engine_state = scenario.get(
-            "engineState", DEFAULT_STATE_COPY["engine_state"]
+            "engineState", DEFAULT_STATE["engine_state"]
         )  # running, stopped
         self.remainingUnlockedDoors = scenario.get(
-            "remainingUnlockedDoors", DEFAULT_STATE_COPY["remainingUnlockedDoors"]
+            "remainingUnlockedDoors", DEFAULT_STATE["remainingUnlockedDoors"]
         )  # driver, passenger, rear_left, rear_right
-        self.doorStatus = scenario.get(
-            "doorStatus",
-            DEFAULT_STATE_COPY["doorStatus"],
+        # doorStatus is the only mutable default, so it is the only one copied
+        self.doorStatus = (
+            scenario["doorStatus"]
+            if "doorStatus" in scenario
+            else deepcopy(DEFAULT_STATE["doorStatus"])
         )
         self.remainingUnlockedDoors = 4 - len(
             [1 for door in self.doorStatus.keys() if self.doorStatus[door] == "locked"]
         )
         self.acTemperature = scenario.get(
-            "acTemperature", DEFAULT_STATE_COPY["acTemperature"]
+            "acTemperature", DEFAULT_STATE["acTemperature"]
         )  # in degree Celsius
-        self.fanSpeed = scenario.get("fanSpeed", DEFAULT_STATE_COPY["fanSpeed"])  # 0 to 100
+        self.fanSpeed = scenario.get("fanSpeed", DEFAULT_STATE["fanSpeed"])  # 0 to 100
         self.acMode = scenario.get(
-            "acMode", DEFAULT_STATE_COPY["acMode"]
+            "acMode", DEFAULT_STATE["acMode"]
         )  # auto, cool, heat, defrost
         self.humidityLevel = scenario.get(
-            "humidityLevel", DEFAULT_STATE_COPY["humidityLevel"]
+            "humidityLevel", DEFAULT_STATE["humidityLevel"]
         )  # in percentage
         self.headLightStatus = scenario.get(
-            "headLightStatus", DEFAULT_STATE_COPY["headLightStatus"]
+            "headLightStatus", DEFAULT_STATE["headLightStatus"]
         )  # on, off
         self.parkingBrakeStatus = scenario.get(
-            "parkingBrakeStatus", DEFAULT_STATE_COPY["parkingBrakeStatus"]
+            "parkingBrakeStatus", DEFAULT_STATE["parkingBrakeStatus"]
         )  # released, engaged
         self._parkingBrakeForce = scenario.get(
-            "parkingBrakeForce", DEFAULT_STATE_COPY["_parkingBrakeForce"]
+            "parkingBrakeForce", DEFAULT_STATE["_parkingBrakeForce"]
         )  # in Newtons
         self._slopeAngle = scenario.get(
-            "slopeAngle", DEFAULT_STATE_COPY["_slopeAngle"]
+            "slopeAngle", DEFAULT_STATE["_slopeAngle"]
         )  # in degrees
         self.brakePedalStatus = scenario.get(
-            "brakePedalStatus", DEFAULT_STATE_COPY["brakePedalStatus"]
+            "brakePedalStatus", DEFAULT_STATE["brakePedalStatus"]
         )  # pressed, released
         self._brakePedalForce = scenario.get(
-            "brakePedalForce", DEFAULT_STATE_COPY["brakePedalForce"]
+            "brakePedalForce", DEFAULT_STATE["brakePedalForce"]
         )  # in Newtons
         self.distanceToNextVehicle = scenario.get(
-            "distanceToNextVehicle", DEFAULT_STATE_COPY["distanceToNextVehicle"]
+            "distanceToNextVehicle", DEFAULT_STATE["distanceToNextVehicle"]
         )  # in meters
         self.cruiseStatus = scenario.get(
-            "cruiseStatus", DEFAULT_STATE_COPY["cruiseStatus"]
+            "cruiseStatus", DEFAULT_STATE["cruiseStatus"]
         )  # active, inactive
-        self.destination = scenario.get("destination", DEFAULT_STATE_COPY["destination"])
+        self.destination = scenario.get("destination", DEFAULT_STATE["destination"])
         self.frontLeftTirePressure = scenario.get(
-            "frontLeftTirePressure", DEFAULT_STATE_COPY["frontLeftTirePressure"]
+            "frontLeftTirePressure", DEFAULT_STATE["frontLeftTirePressure"]
         )
         self.frontRightTirePressure = scenario.get(
-            "frontRightTirePressure", DEFAULT_STATE_COPY["frontRightTirePressure"]
+            "frontRightTirePressure", DEFAULT_STATE["frontRightTirePressure"]
         )
         self.rearLeftTirePressure = scenario.get(
-            "rearLeftTirePressure", DEFAULT_STATE_COPY["rearLeftTirePressure"]
+            "rearLeftTirePressure", DEFAULT_STATE["rearLeftTirePressure"]
         )
         self.rearRightTirePressure = scenario.get(
-            "rearRightTirePressure", DEFAULT_STATE_COPY["rearRightTirePressure"]
+            "rearRightTirePressure", DEFAULT_STATE["rearRightTirePressure"]
         )
 
         self.long_context = long_context
@@ -560,54 +591,9 @@ class VehicleControlAPI:
             distance (float): The distance between the two cities in km.
             intermediaryCities (List[str]): [Optional] The list of intermediary cities between the two cities.
         """
-        if (cityA == "83214" and cityB == "74532") or (
-            cityA == "74532" and cityB == "83214"
-        ):
-            distance = {"distance": 750.0}
-        elif (cityA == "56108" and cityB == "62947") or (
-            cityA == "62947" and cityB == "56108"
-        ):
-            distance = {"distance": 320.0}
-        elif (cityA == "71354" and cityB == "83462") or (
-            cityA == "83462" and cityB == "71354"
-        ):
-            distance = {"distance": 450.0}
-        elif (cityA == "47329" and cityB == "52013") or (
-            cityA == "52013" and cityB == "47329"
-        ):
-            distance = {"distance": 290.0}
-        elif (cityA == "69238" and cityB == "51479") or (
-            cityA == "51479" and cityB == "69238"
-        ):
-            distance = {"distance": 630.0}
-        elif (cityA == "94016" and cityB == "83214") or (
-            cityA == "83214" and cityB == "94016"
-        ):
-            distance = {"distance": 980.0}
-        elif (cityA == "94016" and cityB == "94704") or (
-            cityA == "94704" and cityB == "94016"
-        ):
-            distance = {"distance": 600.0}
-        elif (cityA == "94704" and cityB == "08540") or (
-            cityA == "08540" and cityB == "94704"
-        ):
-            distance = {"distance": 2550.0}
-        elif (cityA == "94016" and cityB == "08540") or (
-            cityA == "08540" and cityB == "94016"
-        ):
-            distance = {"distance": 1950.0}
-        elif (cityA == "62947" and cityB == "47329") or (
-            cityA == "47329" and cityB == "62947"
-        ):
-            distance = {"distance": 1053.0}
-        elif (cityA == "94016" and cityB == "62947") or (
-            cityA == "62947" and cityB == "94016"
-        ):
-            distance = {"distance": 780.0}
-        elif (cityA == "74532" and cityB == "94016") or (
-            cityA == "94016" and cityB == "74532"
-        ):
-            distance = {"distance": 880.0}
+        distance_km = CITY_DISTANCES.get(frozenset((cityA, cityB)))
+        if distance_km is not None:
+            distance = {"distance": distance_km}
         else:
             distance = {"error": "distance not found in database."}
 
@@ -623,30 +609,7 @@ class VehicleControlAPI:
         Returns:
             zipcode (str): The zipcode of the city.
         """
-        if city == "Rivermist":
-            return {"zipcode": "83214"}
-        elif city == "Stonebrook":
-            return {"zipcode": "74532"}
-        elif city == "Maplecrest":
-            return {"zipcode": "56108"}
-        elif city == "Silverpine":
-            return {"zipcode": "62947"}
-        elif city == "Shadowridge":
-            return {"zipcode": "71354"}
-        elif city == "Sunset Valley":
-            return {"zipcode": "83462"}
-        elif city == "Oakendale":
-            return {"zipcode": "47329"}
-        elif city == "Willowbend":
-            return {"zipcode": "52013"}
-        elif city == "Crescent Hollow":
-            return {"zipcode": "69238"}
-        elif city == "Autumnville":
-            return {"zipcode": "51479"}
-        elif city == "San Francisco":
-            return {"zipcode": "94016"}
-        else:
-            return {"zipcode": "00000"}
+        return {"zipcode": CITY_ZIPCODES.get(city, "00000")}
 
     def set_navigation(self, destination: str) -> Dict[str, str]:
         """
@@ -9,8 +9,8 @@ import requests
 from bs4 import BeautifulSoup
 # from serpapi import GoogleSearch
 # from serpapi import BaiduSearch
-def baidu_search(params):
-    response = requests.get("https://serpapi.com/search", params=params)
+def baidu_search(session, params):
+    response = session.get("https://serpapi.com/search", params=params)
     return response.json()
 
 ERROR_TEMPLATES = [
@@ -30,11 +30,35 @@ ERROR_TEMPLATES = [
     ),
 ]
 
+# A header that mimics a browser request. This helps avoid 403 Forbidden errors.
+REQUEST_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/112.0.0.0 Safari/537.36"
+    ),
+    "Accept": (
+        "text/html,application/xhtml+xml,application/xml;q=0.9,"
+        "image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7"
+    ),
+    "Accept-Language": "en-US,en;q=0.9",
+    "Accept-Encoding": "gzip, deflate, br",
+    "Connection": "keep-alive",
+    "Upgrade-Insecure-Requests": "1",
+    "Referer": "https://www.google.com/",
+    "Sec-Fetch-Site": "same-origin",
+    "Sec-Fetch-Mode": "navigate",
+    "Sec-Fetch-User": "?1",
+    "Sec-Fetch-Dest": "document",
+}
+
 
 class WebSearchAPI:
     def __init__(self):
         self._api_description = "This tool belongs to the Web Search API category. It provides functions to search the web and browse search results."
         self.show_snippet = True
+        # One session per instance reuses keep-alive connections without sharing cookies across envs
+        self.session = requests.Session()
         # Note: The following two random generators are used to simulate random errors, but that feature is not currently used
         # This one used to determine if we should simulate a random error
         # Outcome (True means simulate error): [True, False, True, True, False, True, True, True, False, False, True, True, False, True, False, False, False, False, False, True]
@@ -146,7 +170,7 @@ class WebSearchAPI:
         # Infinite retry loop with exponential backoff
         while True:
             try:
-                search = baidu_search(params)
+                search = baidu_search(self.session, params)
                 # search = {"test" : "test"}
                 search_results = search.get_dict()
             except Exception as e:
@@ -194,25 +218,23 @@ class WebSearchAPI:
         search_results = search_results["organic_results"]
 
         # Convert the search results to the desired format
-        results = []
-        for result in search_results[:max_results]:
-            if self.show_snippet:
-                results.append(
-                    {
-                        "title": result["title"],
-                        "href": result["link"],
-                        "body": result["snippet"],
-                    }
-                )
-            else:
-                results.append(
-                    {
-                        "title": result["title"],
-                        "href": result["link"],
-                    }
-                )
-
-        return results
+        # show_snippet is fixed for the whole call, so branch once instead of per result
+        if self.show_snippet:
+            return [
+                {
+                    "title": result["title"],
+                    "href": result["link"],
+                    "body": result["snippet"],
+                }
+                for result in search_results[:max_results]
+            ]
+        return [
+            {
+                "title": result["title"],
+                "href": result["link"],
+            }
+            for result in search_results[:max_results]
+        ]
 
     def fetch_url_content(self, url: str, mode: str = "raw") -> str:
         """
@@ -230,29 +252,7 @@ class WebSearchAPI:
             raise ValueError(f"Invalid URL: {url}")
 
         try:
-            # A header that mimics a browser request. This helps avoid 403 Forbidden errors.
-            # TODO: Is this the best way to do this?
-            headers = {
-                "User-Agent": (
-                    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                    "AppleWebKit/537.36 (KHTML, like Gecko) "
-                    "Chrome/112.0.0.0 Safari/537.36"
-                ),
-                "Accept": (
-                    "text/html,application/xhtml+xml,application/xml;q=0.9,"
-                    "image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7"
-                ),
-                "Accept-Language": "en-US,en;q=0.9",
-                "Accept-Encoding": "gzip, deflate, br",
-                "Connection": "keep-alive",
-                "Upgrade-Insecure-Requests": "1",
-                "Referer": "https://www.google.com/",
-                "Sec-Fetch-Site": "same-origin",
-                "Sec-Fetch-Mode": "navigate",
-                "Sec-Fetch-User": "?1",
-                "Sec-Fetch-Dest": "document",
-            }
-            response = requests.get(url, headers=headers, timeout=20, allow_redirects=True)
+            response = self.session.get(url, headers=REQUEST_HEADERS, timeout=20, allow_redirects=True)
             response.raise_for_status()
 
             # Note: Un-comment this when we want to simulate a random error
@@ -9,6 +9,11 @@ from bfcl_eval.constants.executable_backend_config import (
     STATELESS_CLASSES,
 )
 
+# Characters that are not valid in an instance variable name
+INSTANCE_NAME_INVALID_CHARS_PATTERN = re.compile(r"[-./]")
+# Matches a function name that is immediately followed by an opening parenthesis
+FUNCTION_NAME_PATTERN = re.compile(r"\b([a-zA-Z_]\w*)\s*(?=\()")
+
 
 def execute_multi_turn_func_call(
     func_call_list: list[str],  # a list of strings of func calls
@@ -33,7 +38,7 @@ def execute_multi_turn_func_call(
         instance_name = (
             f"{model_name}_{test_entry_id}_{class_name}_instance"
         )
-        instance_name = re.sub(r'[-./]', '_', instance_name)
+        instance_name = INSTANCE_NAME_INVALID_CHARS_PATTERN.sub("_", instance_name)
         if instance_name not in globals():
             module = importlib.import_module(module_name)
             class_ = getattr(module, class_name)
@@ -137,10 +142,7 @@ def _process_method_calls(function_call_string: str, instance_mapping: dict) ->
             return f"{instance_mapping[func_name]}.{func_name}"
         return func_name
 
-    # Regular expression to match function names
-    pattern = r"\b([a-zA-Z_]\w*)\s*(?=\()"
-
     # Replace function names with their class-prepended versions
-    processed_string = re.sub(pattern, replace_function, function_call_string)
+    processed_string = FUNCTION_NAME_PATTERN.sub(replace_function, function_call_string)
 
     return processed_string